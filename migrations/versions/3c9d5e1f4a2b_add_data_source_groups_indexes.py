@@ -0,0 +1,35 @@
+"""Add indexes on data_source_groups for group/data source lookups.
+
+Revision ID: 3c9d5e1f4a2b
+Revises: 9e8c841d1a30
+Create Date: 2026-10-15 10:12:41.518903
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "3c9d5e1f4a2b"
+down_revision = "9e8c841d1a30"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "data_source_groups_data_source_id_group_id",
+        "data_source_groups",
+        ["data_source_id", "group_id"],
+        unique=False,
+    )
+    op.create_index(
+        "data_source_groups_group_id_data_source_id",
+        "data_source_groups",
+        ["group_id", "data_source_id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("data_source_groups_group_id_data_source_id", table_name="data_source_groups")
+    op.drop_index("data_source_groups_data_source_id_group_id", table_name="data_source_groups")
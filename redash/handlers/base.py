@@ -89,13 +89,17 @@ def paginate(query_set, page, page_size, serializer, **kwargs):
     if page_size > 250 or page_size < 1:
         abort(400, message="Page size is out of range (1-250).")
 
-    results = query_set.paginate(page, page_size)
+    # Fetch the page directly: Flask-SQLAlchemy's paginate() would run the count query a second time.
+    results = query_set.limit(page_size).offset((page - 1) * page_size).all()
+
+    if not results and page != 1:
+        abort(404)
 
     # support for old function based serializers
     if isclass(serializer):
-        items = serializer(results.items, **kwargs).serialize()
+        items = serializer(results, **kwargs).serialize()
     else:
-        items = [serializer(result) for result in results.items]
+        items = [serializer(result) for result in results]
 
     return {"count": count, "page": page, "page_size": page_size, "results": items}
 
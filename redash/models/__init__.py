@@ -304,7 +304,11 @@ class DataSourceGroup(db.Model):
     view_only = Column(db.Boolean, default=False)
 
     __tablename__ = "data_source_groups"
-    __table_args__ = ({"extend_existing": True},)
+    __table_args__ = (
+        db.Index("data_source_groups_data_source_id_group_id", "data_source_id", "group_id"),
+        db.Index("data_source_groups_group_id_data_source_id", "group_id", "data_source_id"),
+        {"extend_existing": True},
+    )
 
 
 @generic_repr("id", "org_id", "data_source_id", "query_hash", "runtime", "retrieved_at")
@@ -878,14 +882,12 @@ class Favorite(TimestampMixin, db.Model):
             return []
 
         object_type = str(objects[0].__class__.__name__)
-        return [
-            fav.object_id
-            for fav in cls.query.filter(
-                cls.object_id.in_([o.id for o in objects]),
-                cls.object_type == object_type,
-                cls.user_id == user,
-            )
-        ]
+        favorites = db.session.query(cls.object_id).filter(
+            cls.object_id.in_([o.id for o in objects]),
+            cls.object_type == object_type,
+            cls.user_id == user,
+        )
+        return [object_id for (object_id,) in favorites]
 
 
 OPERATORS = {
@@ -1099,18 +1101,21 @@ class Dashboard(ChangeTrackingMixin, TimestampMixin, BelongsToOrgMixin, db.Model
 
     @classmethod
     def all(cls, org, group_ids, user_id):
-        query = (
-            Dashboard.query.options(joinedload(Dashboard.user).load_only("id", "name", "details", "email"))
-            .distinct(cls.lowercase_name, Dashboard.created_at, Dashboard.slug)
-            .outerjoin(Widget)
-            .outerjoin(Visualization)
-            .outerjoin(Query)
-            .outerjoin(DataSourceGroup, Query.data_source_id == DataSourceGroup.data_source_id)
-            .filter(
-                Dashboard.is_archived.is_(False),
-                (DataSourceGroup.group_id.in_(group_ids) | (Dashboard.user_id == user_id)),
-                Dashboard.org == org,
-            )
+        # Dashboards with at least one widget backed by a data source the groups have access to.
+        # Filtering through a subquery (semi-join) avoids multiplying dashboard rows per widget,
+        # so no DISTINCT is needed to collapse them again.
+        accessible_dashboard_ids = (
+            db.session.query(Widget.dashboard_id)
+            .join(Visualization, Widget.visualization_id == Visualization.id)
+            .join(Query, Visualization.query_id == Query.id)
+            .join(DataSourceGroup, Query.data_source_id == DataSourceGroup.data_source_id)
+            .filter(DataSourceGroup.group_id.in_(group_ids))
+        )
+
+        query = Dashboard.query.options(joinedload(Dashboard.user).load_only("id", "name", "details", "email")).filter(
+            Dashboard.is_archived.is_(False),
+            (Dashboard.id.in_(accessible_dashboard_ids) | (Dashboard.user_id == user_id)),
+            Dashboard.org == org,
         )
 
         query = query.filter(or_(Dashboard.user_id == user_id, Dashboard.is_draft.is_(False)))
@@ -2,7 +2,6 @@ import hashlib
 import itertools
 import logging
 import time
-from functools import reduce
 from operator import or_
 
 from flask import current_app, request_started, url_for
@@ -65,13 +64,7 @@ class PermissionsCheckMixin:
         return self.has_permissions((permission,))
 
     def has_permissions(self, permissions):
-        has_permissions = reduce(
-            lambda a, b: a and b,
-            [permission in self.permissions for permission in permissions],
-            True,
-        )
-
-        return has_permissions
+        return set(permissions).issubset(self.permissions)
 
 
 @generic_repr("id", "name", "email")
@@ -171,8 +164,17 @@ class User(TimestampMixin, db.Model, BelongsToOrgMixin, UserMixin, PermissionsCh
 
     @property
     def permissions(self):
-        # TODO: this should be cached.
-        return list(itertools.chain(*[g.permissions for g in Group.query.filter(Group.id.in_(self.group_ids))]))
+        # Cached on the instance (which lives for a single request) and keyed by the group ids,
+        # so permission checks don't query the groups table again unless the membership changed.
+        group_ids = tuple(self.group_ids or ())
+        cached = getattr(self, "_permissions_cache", None)
+
+        if cached is None or cached[0] != group_ids:
+            rows = db.session.query(Group.permissions).filter(Group.id.in_(group_ids))
+            permissions = list(itertools.chain(*[group_permissions for (group_permissions,) in rows]))
+            self._permissions_cache = cached = (group_ids, permissions)
+
+        return cached[1]
 
     @classmethod
     def get_by_org(cls, org):
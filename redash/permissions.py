@@ -2,7 +2,6 @@ import functools
 
 from flask_login import current_user
 from flask_restful import abort
-from funcy import flatten
 
 view_only = True
 not_view_only = False
@@ -32,21 +31,18 @@ def has_access_to_object(obj, api_key, need_view_only):
 
 
 def has_access_to_groups(obj, user, need_view_only):
-    groups = obj.groups if hasattr(obj, "groups") else obj
-
     if "admin" in user.permissions:
         return True
 
-    matching_groups = set(groups.keys()).intersection(user.group_ids)
-
-    if not matching_groups:
-        return False
+    groups = getattr(obj, "groups", obj)
 
-    required_level = 1 if need_view_only else 2
+    matching_groups = groups.keys() & set(user.group_ids)
 
-    group_level = 1 if all(flatten([groups[group] for group in matching_groups])) else 2
+    if need_view_only:
+        return bool(matching_groups)
 
-    return required_level <= group_level
+    # Full access requires at least one matching group that isn't view only.
+    return any(not groups[group] for group in matching_groups)
 
 
 def require_access(obj, user, need_view_only):
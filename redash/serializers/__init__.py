@@ -8,6 +8,7 @@ from flask_login import current_user
 from funcy import project
 from rq.job import JobStatus
 from rq.timeouts import JobTimeoutException
+from sqlalchemy.orm import joinedload
 
 from redash import models
 from redash.models.parameterized_query import ParameterizedQuery
@@ -55,10 +56,8 @@ def public_dashboard(dashboard):
         ("name", "layout", "dashboard_filters_enabled", "updated_at", "created_at", "options"),
     )
 
-    widget_list = (
-        models.Widget.query.filter(models.Widget.dashboard_id == dashboard.id)
-        .outerjoin(models.Visualization)
-        .outerjoin(models.Query)
+    widget_list = models.Widget.query.filter(models.Widget.dashboard_id == dashboard.id).options(
+        joinedload(models.Widget.visualization).joinedload(models.Visualization.query_rel)
     )
 
     dashboard_dict["widgets"] = [public_widget(w) for w in widget_list]
@@ -196,16 +195,38 @@ def serialize_alert(alert, full=True):
     return d
 
 
+def can_view_widget_query(query, user, access_by_data_source):
+    # Group permissions are granted per data source, so widgets backed by the same data
+    # source share the same answer. API keys are matched per query and can't be reused.
+    if user.is_api_user():
+        return has_access(query, user, view_only)
+
+    if query.data_source_id not in access_by_data_source:
+        access_by_data_source[query.data_source_id] = has_access(query, user, view_only)
+
+    return access_by_data_source[query.data_source_id]
+
+
 def serialize_dashboard(obj, with_widgets=False, user=None, with_favorite_state=True):
     layout = obj.layout
 
     widgets = []
 
     if with_widgets:
-        for w in obj.widgets:
+        # Load each widget's visualization, query and the query's data source and users in the same
+        # statement, instead of lazy loading them one widget at a time.
+        query_loader = joinedload(models.Widget.visualization).joinedload(models.Visualization.query_rel)
+        widget_list = obj.widgets.options(
+            query_loader.joinedload(models.Query.data_source),
+            query_loader.joinedload(models.Query.user),
+            query_loader.joinedload(models.Query.last_modified_by),
+        )
+
+        access_by_data_source = {}
+        for w in widget_list:
             if w.visualization_id is None:
                 widgets.append(serialize_widget(w))
-            elif user and has_access(w.visualization.query_rel, user, view_only):
+            elif user and can_view_widget_query(w.visualization.query_rel, user, access_by_data_source):
                 widgets.append(serialize_widget(w))
             else:
                 widget = project(
@@ -1,3 +1,5 @@
+from mock import patch
+
 from redash.models import AccessPermission, ApiKey, Dashboard, db
 from redash.permissions import ACCESS_TYPE_MODIFY
 from redash.serializers import serialize_dashboard
@@ -82,6 +84,50 @@ class TestDashboardResourceGet(BaseTestCase):
         self.assertTrue(rv.json["widgets"][0]["restricted"])
         self.assertNotIn("restricted", rv.json["widgets"][1])
 
+    def test_get_dashboard_filters_widgets_per_data_source(self):
+        dashboard = self.factory.create_dashboard()
+
+        restricted_ds = self.factory.create_data_source(group=self.factory.create_group())
+        restricted_query = self.factory.create_query(data_source=restricted_ds)
+        restricted_widgets = [
+            self.factory.create_widget(
+                visualization=self.factory.create_visualization(query_rel=restricted_query),
+                dashboard=dashboard,
+            )
+            for _ in range(2)
+        ]
+        widgets = [self.factory.create_widget(dashboard=dashboard) for _ in range(2)]
+        db.session.commit()
+
+        rv = self.make_request("get", "/api/dashboards/{0}".format(dashboard.id))
+        self.assertEqual(rv.status_code, 200)
+
+        restricted = {w["id"]: w.get("restricted", False) for w in rv.json["widgets"]}
+        self.assertEqual(restricted, {**{w.id: True for w in restricted_widgets}, **{w.id: False for w in widgets}})
+
+    def test_get_dashboard_loads_widgets_without_per_widget_queries(self):
+        def count_selects(dashboard_id):
+            path = "/api/dashboards/{0}".format(dashboard_id)
+            # Warm up per-request caches (e.g. the user's permissions), then make every widget row stale
+            # again so the measured request has to load them.
+            self.make_request("get", path)
+            db.session.expire_all()
+            with patch("statsd.StatsClient.timing") as timing:
+                rv = self.make_request("get", path)
+            self.assertEqual(rv.status_code, 200)
+            return len([c for c in timing.call_args_list if c.args[0].endswith(".select")])
+
+        dashboard = self.factory.create_dashboard()
+        self.factory.create_widget(dashboard=dashboard)
+        db.session.commit()
+        single_widget_selects = count_selects(dashboard.id)
+
+        for _ in range(3):
+            self.factory.create_widget(dashboard=Dashboard.query.get(dashboard.id))
+        db.session.commit()
+
+        self.assertEqual(single_widget_selects, count_selects(dashboard.id))
+
     def test_get_non_existing_dashboard(self):
         rv = self.make_request("get", "/api/dashboards/-1")
         self.assertEqual(rv.status_code, 404)
@@ -34,3 +34,12 @@ class TestQueryFavoriteListResource(BaseTestCase):
     def test_get_favorites(self):
         rv = self.make_request("get", "/api/queries/favorites")
         self.assertEqual(rv.status_code, 200)
+
+    def test_marks_favorites_in_list(self):
+        favorite = self.factory.create_query()
+        other = self.factory.create_query()
+        self.make_request("post", "/api/queries/{}/favorite".format(favorite.id))
+
+        rv = self.make_request("get", "/api/queries")
+        is_favorite = {q["id"]: q["is_favorite"] for q in rv.json["results"]}
+        self.assertEqual(is_favorite, {favorite.id: True, other.id: False})
@@ -5,26 +5,27 @@ from werkzeug.exceptions import BadRequest
 
 from redash.handlers.base import paginate
 
-
-class DummyResults:
-    items = [i for i in range(25)]
-
-
-dummy_results = DummyResults()
+dummy_items = [i for i in range(25)]
 
 
 class TestPaginate(TestCase):
     def setUp(self):
         self.query_set = MagicMock()
         self.query_set.count = MagicMock(return_value=102)
-        self.query_set.paginate = MagicMock(return_value=dummy_results)
+        self.query_set.limit.return_value.offset.return_value.all = MagicMock(return_value=dummy_items)
 
     def test_returns_paginated_results(self):
         page = paginate(self.query_set, 1, 25, lambda x: x)
         self.assertEqual(page["page"], 1)
         self.assertEqual(page["page_size"], 25)
         self.assertEqual(page["count"], 102)
-        self.assertEqual(page["results"], dummy_results.items)
+        self.assertEqual(page["results"], dummy_items)
+
+    def test_counts_results_once(self):
+        paginate(self.query_set, 3, 25, lambda x: x)
+        self.query_set.count.assert_called_once_with()
+        self.query_set.limit.assert_called_once_with(25)
+        self.query_set.limit.return_value.offset.assert_called_once_with(50)
 
     def test_raises_error_for_bad_page(self):
         self.assertRaises(BadRequest, lambda: paginate(self.query_set, -1, 25, lambda x: x))
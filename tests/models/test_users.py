@@ -1,3 +1,5 @@
+from mock import patch
+
 from redash import redis_connection
 from redash.models import ApiUser, User, db
 from redash.models.users import LAST_ACTIVE_KEY, sync_last_active_at
@@ -24,6 +26,30 @@ class TestUserUpdateGroupAssignments(BaseTestCase):
         self.assertCountEqual([user.org.default_group.id, new_group.id], user.group_ids)
 
 
+class TestUserPermissions(BaseTestCase):
+    def test_permissions_are_cached(self):
+        user = self.factory.user
+        permissions = user.permissions
+
+        with patch("statsd.StatsClient.timing") as timing:
+            self.assertEqual(permissions, user.permissions)
+        self.assertNotIn("db.groups.select", [c.args[0] for c in timing.call_args_list])
+
+    def test_permissions_follow_group_changes(self):
+        user = self.factory.create_user(group_ids=[self.factory.default_group.id])
+        self.assertNotIn("admin", user.permissions)
+
+        user.group_ids.append(self.factory.admin_group.id)
+        self.assertIn("admin", user.permissions)
+
+    def test_has_permissions_requires_all_permissions(self):
+        user = self.factory.create_user(group_ids=[self.factory.default_group.id])
+
+        self.assertTrue(user.has_permissions(()))
+        self.assertTrue(user.has_permissions(("view_query", "list_dashboards")))
+        self.assertFalse(user.has_permissions(("view_query", "admin")))
+
+
 class TestUserFindByEmail(BaseTestCase):
     def test_finds_users(self):
         user = self.factory.create_user(email="test@example.com")
@@ -1,10 +1,16 @@
-from collections import namedtuple
-
 from redash import models
 from redash.permissions import has_access
 from tests import BaseTestCase
 
-MockUser = namedtuple("MockUser", ["permissions", "group_ids"])
+
+class MockUser:
+    __slots__ = ("permissions", "group_ids")
+
+    def __init__(self, permissions, group_ids):
+        self.permissions = permissions
+        self.group_ids = group_ids
+
+
 view_only = True
 
 
@@ -15,6 +21,16 @@ class TestHasAccess(BaseTestCase):
         self.assertTrue(has_access({}, user, view_only))
         self.assertTrue(has_access({}, user, not view_only))
 
+    def test_allows_admin_without_resolving_groups(self):
+        class Restricted:
+            @property
+            def groups(self):
+                raise AssertionError("groups shouldn't be resolved for admins")
+
+        user = MockUser(["admin"], [])
+
+        self.assertTrue(has_access(Restricted(), user, not view_only))
+
     def test_allows_if_user_member_in_group_with_view_access(self):
         user = MockUser([], [1])
 